@@ -1,7 +1,7 @@
 import pdfplumber
 import pandas as pd
 import re
-from datetime import datetime
+from bisect import bisect_left, bisect_right
 
 # =========================================================
 # MONTH MAP (UNCHANGED)
@@ -15,7 +15,7 @@ MONTH_MAP = {
 }
 
 # =========================================================
-# HELPERS (UNCHANGED)
+# HELPERS
 # =========================================================
 
 def detect_month_from_df(df):
@@ -31,6 +31,25 @@ def detect_month_from_df(df):
 DATE_RE = re.compile(r"\d{1,2}/\d{2}/\d{2}")
 AMOUNT_RE = re.compile(r"\d{1,3}(?:,\d{3})*\.\d{2}-?")
 ZERO_RE = re.compile(r"^0?\.00-?$")
+TOTAL_AMOUNT_RE = re.compile(r"([\d,]+\.\d{2})")
+
+# Strips thousands separators in one C-level pass
+COMMA_TABLE = str.maketrans("", "", ",")
+
+
+def to_float(v):
+    # AMOUNT_RE guarantees "1,234.56" with an optional trailing "-"
+    v = v.translate(COMMA_TABLE)
+    if v[-1] == "-":
+        return -float(v[:-1])
+    return float(v)
+
+
+def to_iso_date(text):
+    # "d/mm/yy" -> "yyyy-mm-dd" by slicing; same century rule as %y
+    dd, mm, yy = text.split("/")
+    century = "20" if yy < "69" else "19"
+    return f"{century}{yy}-{mm}-{dd.zfill(2)}"
 
 # =========================================================
 # SUMMARY TOTALS (UNCHANGED)
@@ -45,11 +64,11 @@ def extract_agrobank_summary_totals(pdf):
         for line in text.splitlines():
             u = line.upper()
             if "TOTAL DEBIT" in u:
-                m = re.search(r"([\d,]+\.\d{2})", line)
+                m = TOTAL_AMOUNT_RE.search(line)
                 if m:
                     total_debit = float(m.group(1).replace(",", ""))
             if "TOTAL CREDIT" in u:
-                m = re.search(r"([\d,]+\.\d{2})", line)
+                m = TOTAL_AMOUNT_RE.search(line)
                 if m:
                     total_credit = float(m.group(1).replace(",", ""))
         if total_debit is not None and total_credit is not None:
@@ -58,9 +77,10 @@ def extract_agrobank_summary_totals(pdf):
     return total_debit, total_credit
 
 # =========================================================
-# CORE PARSER (UNCHANGED)
+# CORE PARSER
 # =========================================================
 
+# Returns raw float debit/credit/balance; extract_agro_bank rounds to 2 dp
 def parse_agro_bank(pdf, source_file):
     transactions = []
     previous_balance = None
@@ -70,6 +90,8 @@ def parse_agro_bank(pdf, source_file):
     for page_num, page in enumerate(pdf.pages, start=1):
         words = page.extract_words(use_text_flow=True, keep_blank_chars=False)
         words = sorted(words, key=lambda w: (w["top"], w["x0"]))
+        # Sorted tops let each dated word find its line by bisection
+        tops = [w["top"] for w in words]
 
         i = 0
         while i < len(words):
@@ -77,35 +99,30 @@ def parse_agro_bank(pdf, source_file):
 
             if DATE_RE.fullmatch(text):
                 y_ref = words[i]["top"]
-                same_line = [w for w in words if abs(w["top"] - y_ref) <= 2]
-
-                description = " ".join(
-                    w["text"] for w in same_line
-                    if not DATE_RE.fullmatch(w["text"])
-                    and not AMOUNT_RE.fullmatch(w["text"])
-                    and not ZERO_RE.fullmatch(w["text"])
-                ).strip()
-
-                amounts = [
-                    (w["x0"], w["text"])
-                    for w in same_line
-                    if AMOUNT_RE.fullmatch(w["text"])
+                same_line = words[
+                    bisect_left(tops, y_ref - 2):bisect_right(tops, y_ref + 2)
                 ]
 
+                # one pass: amounts vs description words
+                desc_words = []
+                amounts = []
+                for w in same_line:
+                    t = w["text"]
+                    if AMOUNT_RE.fullmatch(t):
+                        amounts.append((w["x0"], t))
+                    elif not ZERO_RE.fullmatch(t) and not DATE_RE.fullmatch(t):
+                        desc_words.append(t)
+
+                description = " ".join(desc_words).strip()
+
                 if not amounts:
                     i += 1
                     continue
 
                 amounts.sort(key=lambda x: x[0])
 
-                def to_float(v):
-                    v = v.replace(",", "")
-                    if v.endswith("-"):
-                        return -float(v[:-1])
-                    return float(v)
-
                 balance = to_float(amounts[-1][1])
-                iso_date = datetime.strptime(text, "%d/%m/%y").strftime("%Y-%m-%d")
+                iso_date = to_iso_date(text)
                 desc_upper = description.upper()
 
                 if "BEGINNING BALANCE" in desc_upper:
@@ -122,16 +139,16 @@ def parse_agro_bank(pdf, source_file):
                 if previous_balance is not None:
                     delta = balance - previous_balance
                     if delta > 0.0001:
-                        credit = round(delta, 2)
+                        credit = delta
                     elif delta < -0.0001:
-                        debit = round(abs(delta), 2)
+                        debit = abs(delta)
 
                 transactions.append({
                     "date": iso_date,
                     "description": description,
                     "debit": debit or 0.0,
                     "credit": credit or 0.0,
-                    "balance": round(balance, 2)
+                    "balance": balance
                 })
 
                 previous_balance = balance
@@ -156,12 +173,17 @@ def parse_agro_bank(pdf, source_file):
 def extract_agro_bank(pdf_path):
     """
     Streamlit-compatible extractor.
-    DO NOT modify parsing logic.
+    Rounds the parser's raw money columns to 2 dp.
     """
 
     with pdfplumber.open(pdf_path) as pdf:
         txns = parse_agro_bank(pdf, source_file=pdf_path)
 
-    return pd.DataFrame(txns, columns=[
+    df = pd.DataFrame(txns, columns=[
         "date", "description", "debit", "credit", "balance"
     ])
+
+    # Round once per column instead of per row inside the parser
+    money = ["debit", "credit", "balance"]
+    df[money] = df[money].round(2)
+    return df
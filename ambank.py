@@ -13,18 +13,41 @@ MONTH_MAP = {
     "OCT": "October", "NOV": "November", "DEC": "December"
 }
 
+YEAR_RE = re.compile(r"(20\d{2})")
+DATE_START_RE = re.compile(r"^(\d{2})([A-Za-z]{3})")
+AMOUNT_TOKEN_RE = re.compile(r"[\d,]+\.\d{2}[A-Za-z]*$")
+HAS_AMOUNT_RE = re.compile(r"\d+\.\d{2}")
+OPENING_AMOUNT_RE = re.compile(r"([\d,]+\.\d{2})")
+NOISE_LINE_RE = re.compile(r"PAGE|STATEMENT", re.IGNORECASE)
+
+# Fallback credit markers (substring match, case-insensitive)
+CREDIT_KEYWORDS = ["CR", "CREDIT", "DEPOSIT", "INWARD"]
+CREDIT_RE = re.compile("|".join(CREDIT_KEYWORDS), re.IGNORECASE)
+
+COMMA_TABLE = str.maketrans("", "", ",")
+
 def parse_amount(s):
     if not s:
         return 0.0
-    s = s.upper().replace(",", "").strip()
+    s = s.upper().translate(COMMA_TABLE).strip()
     neg = "DR" in s
-    s = s.replace("DR", "").replace("CR", "")
+    # Most amounts carry no DR/CR suffix; only strip when one is present
+    if neg or "CR" in s:
+        s = s.replace("DR", "").replace("CR", "")
     try:
         v = float(s)
         return -v if neg else v
     except:
         return 0.0
 
+def find_opening_balance(text):
+    for l in text.splitlines():
+        if "OPENING BALANCE" in l.upper():
+            m = OPENING_AMOUNT_RE.search(l)
+            if m:
+                return float(m.group(1).replace(",", ""))
+    return None
+
 def clean_date(day, mon, year):
     return f"{day} {MONTH_MAP.get(mon.upper(), mon)} {year}"
 
@@ -34,27 +57,33 @@ def clean_date(day, mon, year):
 
 def extract_ambank(pdf_path):
     rows = []
+    row_desc_parts = []  # description fragments, parallel to rows
     current_tx = None
     prev_balance = None
+    opening_balance = 0.0
 
     # Detect year from filename (fallback 2024)
-    y = re.search(r"(20\d{2})", pdf_path)
+    y = YEAR_RE.search(pdf_path)
     year = y.group(1) if y else "2024"
 
-    date_start = re.compile(r"^(\d{2})([A-Za-z]{3})")
-
     with pdfplumber.open(pdf_path) as pdf:
         for page in pdf.pages:
             text = page.extract_text()
             if not text:
                 continue
 
+            # Kept for the no-transactions case, so the PDF is read once
+            if "OPENING BALANCE" in text.upper():
+                found = find_opening_balance(text)
+                if found is not None:
+                    opening_balance = found
+
             for line in text.splitlines():
                 line = line.strip()
                 if not line:
                     continue
 
-                m = date_start.match(line)
+                m = DATE_START_RE.match(line)
 
                 # ======================
                 # NEW TRANSACTION LINE
@@ -68,11 +97,12 @@ def extract_ambank(pdf_path):
 
                     # scan from RIGHT → LEFT
                     for i in range(len(parts)-1, -1, -1):
-                        if re.match(r"[\d,]+\.\d{2}[A-Za-z]*$", parts[i]):
-                            nums.insert(0, parts[i])
+                        if AMOUNT_TOKEN_RE.match(parts[i]):
+                            nums.append(parts[i])
                         else:
                             desc_parts = parts[:i+1]
                             break
+                    nums.reverse()  # collected right-to-left
 
                     description = " ".join(desc_parts[1:])
                     values = [parse_amount(x) for x in nums]
@@ -96,12 +126,12 @@ def extract_ambank(pdf_path):
                                 debit = tx_amt
                             else:
                                 # fallback
-                                if any(k in description.upper() for k in ["CR", "CREDIT", "DEPOSIT", "INWARD"]):
+                                if CREDIT_RE.search(description):
                                     credit = tx_amt
                                 else:
                                     debit = tx_amt
                         else:
-                            if any(k in description.upper() for k in ["CR", "CREDIT", "DEPOSIT", "INWARD"]):
+                            if CREDIT_RE.search(description):
                                 credit = tx_amt
                             else:
                                 debit = tx_amt
@@ -115,6 +145,7 @@ def extract_ambank(pdf_path):
                         }
 
                         rows.append(current_tx)
+                        row_desc_parts.append([description])
                         prev_balance = balance
 
                 # ======================
@@ -122,10 +153,12 @@ def extract_ambank(pdf_path):
                 # ======================
                 else:
                     if current_tx:
-                        if not re.search(r"\d+\.\d{2}", line) and \
-                           "PAGE" not in line.upper() and \
-                           "STATEMENT" not in line.upper():
-                            current_tx["description"] += " " + line
+                        if not HAS_AMOUNT_RE.search(line) and \
+                           not NOISE_LINE_RE.search(line):
+                            row_desc_parts[-1].append(line)
+
+    for tx, parts in zip(rows, row_desc_parts):
+        tx["description"] = " ".join(parts)
 
     df = pd.DataFrame(rows)
 
@@ -133,19 +166,6 @@ def extract_ambank(pdf_path):
     # NO TRANSACTIONS CASE
     # ======================
     if df.empty:
-        opening_balance = 0.0
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                t = page.extract_text()
-                if not t:
-                    continue
-                for l in t.splitlines():
-                    if "OPENING BALANCE" in l.upper():
-                        m = re.search(r"([\d,]+\.\d{2})", l)
-                        if m:
-                            opening_balance = float(m.group(1).replace(",", ""))
-                            break
-
         df = pd.DataFrame([{
             "date": "",
             "description": "Balance B/F (No transactions)",
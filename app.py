@@ -1,5 +1,7 @@
 import streamlit as st
+import os
 import tempfile
+import numpy as np
 import pandas as pd
 from io import BytesIO
 from openpyxl import Workbook
@@ -58,21 +60,31 @@ if not uploaded_files:
 # ===============================
 # OPENING BALANCE FORMULA (YOUR ORIGINAL)
 # ===============================
-def opening_from_first_row(r):
-    return r["balance"] - r["credit"] + r["debit"]
+def opening_from_first_row(balance, credit, debit):
+    return balance - credit + debit
 
 # ===============================
 # EXTRACT PER FILE
 # ===============================
-extractor = BANK_EXTRACTORS[bank_choice]
-monthly_data = {}
-
-for f in uploaded_files:
+# Streamlit reruns the whole script on every widget change; cache the
+# parsed statement on (bank, file bytes) so re-uploads skip the PDF work
+@st.cache_data(show_spinner=False)
+def run_extractor(bank, data):
     with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-        tmp.write(f.read())
+        tmp.write(data)
         path = tmp.name
 
-    df = extractor(path)
+    # Extractors take a path, so the upload still goes through a temp
+    # file; remove it once parsed instead of leaving one per upload
+    try:
+        return BANK_EXTRACTORS[bank](path)
+    finally:
+        os.remove(path)
+
+monthly_data = {}
+
+for f in uploaded_files:
+    df = run_extractor(bank_choice, f.getvalue())
     if df is None or df.empty:
         continue
 
@@ -144,20 +156,23 @@ for month, df in months:
 rows = []
 
 for month, df in months:
-    first = df.iloc[0]
-    last = df.iloc[-1]
+    # Reduce on plain arrays; the nan-aware forms keep pandas' skipna
+    balance = df["balance"].to_numpy(dtype=float)
 
-    opening = opening_from_first_row(first)
-    ending = last["balance"]
+    # Scalar reads via iat / the array instead of building row Series
+    opening = opening_from_first_row(
+        balance[0], df["credit"].iat[0], df["debit"].iat[0]
+    )
+    ending = balance[-1]
 
-    highest = df["balance"].max()
-    lowest = df["balance"].min()
+    highest = np.nanmax(balance)
+    lowest = np.nanmin(balance)
 
     rows.append({
         "Month": month,
         "Opening": round(opening, 2),
-        "Debit": round(df["debit"].sum(), 2),
-        "Credit": round(df["credit"].sum(), 2),
+        "Debit": round(np.nansum(df["debit"].to_numpy(dtype=float)), 2),
+        "Credit": round(np.nansum(df["credit"].to_numpy(dtype=float)), 2),
         "Ending": round(ending, 2),
         "Highest": round(highest, 2),
         "Lowest": round(lowest, 2),
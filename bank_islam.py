@@ -13,10 +13,17 @@ MONTH_MAP = {
     "10": "October", "11": "November", "12": "December"
 }
 
+CASA_DATE_RE = re.compile(r"\d{2}/\d{2}/\d{4}")
+DATE_RE = re.compile(r"\d{1,2}/\d{1,2}/\d{2,4}")
+
+# Drops line breaks and thousands separators in one pass
+NUM_CLEAN_TABLE = str.maketrans("", "", "\n,")
+
 def to_float(v):
+    if not v:
+        return 0.0
     try:
-        s = str(v).replace("\n", "").replace(",", "")
-        return float(s)
+        return float(str(v).translate(NUM_CLEAN_TABLE))
     except:
         return 0.0
 
@@ -25,7 +32,8 @@ def to_float(v):
 # MAIN EXTRACTOR
 # ==========================
 def extract_bank_islam(pdf_path):
-    txns = []
+    # Column-wise buffers, one entry per transaction
+    dates, descs, debits, credits, balances = [], [], [], [], []
 
     with pdfplumber.open(pdf_path) as pdf:
         for page in pdf.pages:
@@ -57,16 +65,16 @@ def extract_bank_islam(pdf_path):
                             continue
 
                         date = raw_date.split("\n")[0].strip()
-                        if not re.match(r"\d{2}/\d{2}/\d{4}", date):
+                        if not CASA_DATE_RE.match(date):
                             continue
 
-                        txns.append({
-                            "date": date,
-                            "description": desc.replace("\n", " ").strip(),
-                            "debit": to_float(debit),
-                            "credit": to_float(credit),
-                            "balance": to_float(balance),
-                        })
+                        desc = desc.replace("\n", " ").strip()
+
+                        dates.append(date)
+                        descs.append(desc)
+                        debits.append(to_float(debit))
+                        credits.append(to_float(credit))
+                        balances.append(to_float(balance))
                     except:
                         continue
 
@@ -81,23 +89,26 @@ def extract_bank_islam(pdf_path):
                         credit  = row[3]
                         balance = row[4]
 
-                        if not date or not re.match(r"\d{1,2}/\d{1,2}/\d{2,4}", date):
+                        if not date or not DATE_RE.match(date):
                             continue
 
-                        txns.append({
-                            "date": date.strip(),
-                            "description": desc.replace("\n", " ").strip(),
-                            "debit": to_float(debit),
-                            "credit": to_float(credit),
-                            "balance": to_float(balance),
-                        })
+                        desc = desc.replace("\n", " ").strip()
+
+                        dates.append(date.strip())
+                        descs.append(desc)
+                        debits.append(to_float(debit))
+                        credits.append(to_float(credit))
+                        balances.append(to_float(balance))
                     except:
                         continue
 
-    df = pd.DataFrame(
-        txns,
-        columns=["date", "description", "debit", "credit", "balance"]
-    )
+    df = pd.DataFrame({
+        "date": dates,
+        "description": descs,
+        "debit": debits,
+        "credit": credits,
+        "balance": balances,
+    })
 
     print(f"✔ Bank Islam extracted {len(df)} rows from {pdf_path}")
     return df
@@ -1,7 +1,7 @@
 import pdfplumber
 import pandas as pd
 import re
-from datetime import datetime
+from bisect import bisect_left, bisect_right
 
 # ==========================
 # REGEX
@@ -10,6 +10,13 @@ DATE_RE = re.compile(r"\d{1,2}/\d{2}/\d{2}")
 AMOUNT_RE = re.compile(r"(?:\d{1,3}(?:,\d{3})*|\d+)?\.\d{2}")
 ZERO_RE = re.compile(r"^0?\.00$")
 
+
+def expand_date(text):
+    # "d/mm/yy" -> "dd/mm/yyyy" by slicing; same century rule as %y
+    dd, mm, yy = text.split("/")
+    century = "20" if yy < "69" else "19"
+    return f"{dd.zfill(2)}/{mm}/{century}{yy}"
+
 # ==========================
 # MAIN EXTRACTOR
 # ==========================
@@ -27,6 +34,7 @@ def extract_bank_muamalat(pdf_path):
 
             # sort visually (top → bottom, left → right)
             words = sorted(words, key=lambda w: (w["top"], w["x0"]))
+            tops = [w["top"] for w in words]
 
             i = 0
             while i < len(words):
@@ -40,24 +48,23 @@ def extract_bank_muamalat(pdf_path):
 
                     y_ref = words[i]["top"]
 
-                    same_line = [
-                        w for w in words
-                        if abs(w["top"] - y_ref) <= 2
+                    # words are sorted by top, so the line is one slice
+                    same_line = words[
+                        bisect_left(tops, y_ref - 2):bisect_right(tops, y_ref + 2)
                     ]
 
-                    description = " ".join(
-                        w["text"] for w in same_line
-                        if not DATE_RE.fullmatch(w["text"])
-                        and not AMOUNT_RE.fullmatch(w["text"])
-                        and not ZERO_RE.fullmatch(w["text"])
-                    ).strip()
-
-                    amounts = [
-                        (w["x0"], w["text"])
-                        for w in same_line
-                        if AMOUNT_RE.fullmatch(w["text"])
-                        and not ZERO_RE.fullmatch(w["text"])
-                    ]
+                    # one pass: amounts (zeros dropped) vs description words
+                    desc_words = []
+                    amounts = []
+                    for w in same_line:
+                        t = w["text"]
+                        if AMOUNT_RE.fullmatch(t):
+                            if not ZERO_RE.fullmatch(t):
+                                amounts.append((w["x0"], t))
+                        elif not DATE_RE.fullmatch(t):
+                            desc_words.append(t)
+
+                    description = " ".join(desc_words).strip()
 
                     if not amounts:
                         i += 1
@@ -86,9 +93,7 @@ def extract_bank_muamalat(pdf_path):
                         else:
                             debit = txn_amount or 0.0
 
-                    iso_date = datetime.strptime(
-                        text, "%d/%m/%y"
-                    ).strftime("%d/%m/%Y")
+                    iso_date = expand_date(text)
 
                     transactions.append({
                         "date": iso_date,
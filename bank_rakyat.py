@@ -2,11 +2,24 @@ import pdfplumber
 import pandas as pd
 import re
 
+DATE_RE = re.compile(r"\d{2}/\d{2}/\d{4}")
+
+# Summary / header rows
+SKIP_WORDS = [
+    "BAKI PERMULAAN",
+    "BAKI PENUTUP",
+    "JUMLAH",
+    "TOTAL",
+    "BIL / NO",
+]
+SKIP_PATTERN = re.compile("|".join(map(re.escape, SKIP_WORDS)), re.IGNORECASE)
+
 # ==========================
 # MAIN EXTRACTOR
 # ==========================
 def extract_bank_rakyat(pdf_path):
-    txns = []
+    # Column-wise buffers, one entry per transaction
+    dates, descs, debits, credits, balances = [], [], [], [], []
 
     def to_float(x):
         try:
@@ -15,7 +28,7 @@ def extract_bank_rakyat(pdf_path):
             return 0.0
 
     def valid_date(x):
-        return bool(re.match(r"\d{2}/\d{2}/\d{4}", str(x).strip()))
+        return bool(DATE_RE.match(str(x).strip()))
 
     with pdfplumber.open(pdf_path) as pdf:
         for page in pdf.pages:
@@ -35,34 +48,27 @@ def extract_bank_rakyat(pdf_path):
                 date, _, desc, debit, credit, balance = row[:6]
 
                 # Skip summaries / headers
-                skip_words = [
-                    "BAKI PERMULAAN",
-                    "BAKI PENUTUP",
-                    "JUMLAH",
-                    "TOTAL",
-                    "BIL / NO",
-                ]
-
-                if any(w in desc.upper() for w in skip_words):
+                if SKIP_PATTERN.search(desc):
                     continue
 
                 if not valid_date(date):
                     continue
 
-                desc = re.sub(r"\s+", " ", desc).strip()
-
-                txns.append({
-                    "date": date,
-                    "description": desc,
-                    "debit": to_float(debit),
-                    "credit": to_float(credit),
-                    "balance": to_float(balance),
-                })
-
-    df = pd.DataFrame(
-        txns,
-        columns=["date", "description", "debit", "credit", "balance"]
-    )
+                desc = " ".join(desc.split())
+
+                dates.append(date)
+                descs.append(desc)
+                debits.append(to_float(debit))
+                credits.append(to_float(credit))
+                balances.append(to_float(balance))
+
+    df = pd.DataFrame({
+        "date": dates,
+        "description": descs,
+        "debit": debits,
+        "credit": credits,
+        "balance": balances,
+    })
 
     print(f"✔ Bank Rakyat extracted {len(df)} rows from {pdf_path}")
     return df
@@ -15,6 +15,13 @@ SUMMARY_KEYWORDS = [
     "ringkasan", "penyata tamat"
 ]
 
+# One scan per line instead of one substring test per keyword
+SUMMARY_PATTERN = re.compile(
+    "|".join(map(re.escape, SUMMARY_KEYWORDS)), re.IGNORECASE
+)
+
+DATE_RE = re.compile(r"\d{2}/\d{2}/\d{4}")
+
 RAW_TXN_PATTERN = re.compile(
     r"(\d{2}/\d{2}/\d{4})\s+(.*?)\s+(-?[0-9,]*\.?\d*)\s+(-?[0-9,]*\.?\d*)\s+(-?[0-9,]*\.?\d*)$"
 )
@@ -24,6 +31,11 @@ def extract_cimb(pdf_path):
     txns = []
     seen = set()
 
+    # Rows normally arrive in date order; track that so the final
+    # to_datetime + sort can be skipped on the common path
+    in_order = True
+    last_key = ""
+
     # -----------------------------
     # HELPERS
     # -----------------------------
@@ -34,11 +46,19 @@ def extract_cimb(pdf_path):
             return 0.0
 
     def valid_date(v):
-        return bool(re.match(r"\d{2}/\d{2}/\d{4}", str(v).strip()))
+        return bool(DATE_RE.match(str(v).strip()))
 
     def is_summary(text):
-        t = text.lower()
-        return any(k in t for k in SUMMARY_KEYWORDS)
+        return SUMMARY_PATTERN.search(text) is not None
+
+    def track_order(date):
+        nonlocal in_order, last_key
+        # "dd/mm/yyyy" -> "yyyymmdd"; anything else forces a full sort
+        key = date[6:10] + date[3:5] + date[:2] if len(date) == 10 else None
+        if key is None or key < last_key:
+            in_order = False
+        else:
+            last_key = key
 
     # -----------------------------
     # PDF PROCESSING
@@ -82,6 +102,7 @@ def extract_cimb(pdf_path):
                         continue
                     seen.add(key)
 
+                    track_order(date.strip())
                     txns.append({
                         "date": date.strip(),
                         "description": desc,
@@ -94,6 +115,11 @@ def extract_cimb(pdf_path):
             # 2️⃣ RAW TEXT FALLBACK (CRITICAL)
             # ===================================================
             text = page.extract_text() or ""
+
+            # Cover / terms pages carry no dd/mm/yyyy at all
+            if not DATE_RE.search(text):
+                continue
+
             for line in text.split("\n"):
                 m = RAW_TXN_PATTERN.search(line)
                 if not m:
@@ -118,6 +144,7 @@ def extract_cimb(pdf_path):
                     continue
                 seen.add(key)
 
+                track_order(date.strip())
                 txns.append({
                     "date": date.strip(),
                     "description": desc.strip(),
@@ -137,9 +164,10 @@ def extract_cimb(pdf_path):
     if df.empty:
         return df
 
-    df["__dt"] = pd.to_datetime(df["date"], dayfirst=True, errors="coerce")
-    df = df.sort_values("__dt", ascending=True)
-    df = df.drop(columns="__dt").reset_index(drop=True)
+    if not in_order:
+        df["__dt"] = pd.to_datetime(df["date"], dayfirst=True, errors="coerce")
+        df = df.sort_values("__dt", ascending=True, kind="mergesort")
+        df = df.drop(columns="__dt").reset_index(drop=True)
 
     print(f"✔ CIMB extracted {len(df)} transactions from {Path(pdf_path).name}")
     return df
@@ -3,6 +3,8 @@ import pandas as pd
 import re
 from datetime import datetime
 
+DATE_RE = re.compile(r"\d{1,2}/\d{1,2}/\d{4}")
+
 # ==================================================
 # HELPERS
 # ==================================================
@@ -72,7 +74,7 @@ def extract_format_b(table):
             continue
 
         date = r[0]
-        if not re.search(r"\d{1,2}/\d{1,2}/\d{4}", str(date)):
+        if not DATE_RE.search(str(date)):
             continue
 
         try:
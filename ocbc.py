@@ -2,21 +2,35 @@ import pdfplumber
 import pandas as pd
 import re
 
+AMOUNT_TOKEN_RE = re.compile(r"[\d,]+\.\d{2}$")
+HAS_AMOUNT_RE = re.compile(r"[\d,]+\.\d{2}")
+
+TX_START_RE = re.compile(
+    r"^(\d{2})\s+"
+    r"(JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC)\s+"
+    r"(\d{4})\s+(.*)"
+)
+BALANCE_BF_RE = re.compile(r"Balance B/F\s+([\d,]+\.\d{2})")
+
+# Page furniture that must not be glued onto a description
+NOISE_LINE_RE = re.compile(
+    r"PAGE|STATEMENT|SUMMARY|TOTAL|WITHDRAWALS|DEPOSITS", re.IGNORECASE
+)
+
+# Description markers that fix the direction without balance math
+CREDIT_MARKER_RE = re.compile(r"CR /IB|CR INWARD", re.IGNORECASE)
+DEBIT_MARKER_RE = re.compile(
+    r"DR /IB|DEBIT AS ADVISED|DUITNOW SC", re.IGNORECASE
+)
+
 
 def extract_ocbc(pdf_path):
     rows = []
+    row_desc_parts = []  # description fragments, parallel to rows
     current_tx = None
     prev_balance = None
     balance_bf = None
 
-    tx_start_pattern = re.compile(
-        r"^(\d{2})\s+"
-        r"(JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC)\s+"
-        r"(\d{4})\s+(.*)"
-    )
-
-    balance_bf_pattern = re.compile(r"Balance B/F\s+([\d,]+\.\d{2})")
-
     with pdfplumber.open(pdf_path) as pdf:
         for page in pdf.pages:
             text = page.extract_text()
@@ -25,7 +39,7 @@ def extract_ocbc(pdf_path):
 
             # ---- Balance B/F first (important for empty months)
             if balance_bf is None:
-                m = balance_bf_pattern.search(text)
+                m = BALANCE_BF_RE.search(text)
                 if m:
                     balance_bf = float(m.group(1).replace(",", ""))
                     prev_balance = balance_bf
@@ -35,7 +49,7 @@ def extract_ocbc(pdf_path):
                 if not line:
                     continue
 
-                m = tx_start_pattern.match(line)
+                m = TX_START_RE.match(line)
 
                 if m:
                     day, mon, year, rest = m.groups()
@@ -45,11 +59,12 @@ def extract_ocbc(pdf_path):
                     desc_parts = []
 
                     for i in range(len(parts) - 1, -1, -1):
-                        if re.match(r"[\d,]+\.\d{2}$", parts[i]):
-                            amounts.insert(0, parts[i])
+                        if AMOUNT_TOKEN_RE.match(parts[i]):
+                            amounts.append(parts[i])
                         else:
                             desc_parts = parts[:i+1]
                             break
+                    amounts.reverse()  # collected right-to-left
 
                     if len(amounts) < 2:
                         continue
@@ -58,18 +73,13 @@ def extract_ocbc(pdf_path):
                     balance = float(amounts[-1].replace(",", ""))
 
                     description = " ".join(desc_parts)
-                    desc_upper = description.upper()
 
                     debit = 0.0
                     credit = 0.0
 
-                    if "CR /IB" in desc_upper or "CR INWARD" in desc_upper:
+                    if CREDIT_MARKER_RE.search(description):
                         credit = tx_amount
-                    elif (
-                        "DR /IB" in desc_upper
-                        or "DEBIT AS ADVISED" in desc_upper
-                        or "DUITNOW SC" in desc_upper
-                    ):
+                    elif DEBIT_MARKER_RE.search(description):
                         debit = tx_amount
                     elif prev_balance is not None:
                         diff = round(balance - prev_balance, 2)
@@ -88,17 +98,18 @@ def extract_ocbc(pdf_path):
 
                     prev_balance = balance
                     current_tx = rows[-1]
+                    row_desc_parts.append([description])
 
                 else:
                     if current_tx:
                         if (
-                            not re.search(r"[\d,]+\.\d{2}", line)
-                            and not any(x in line.upper() for x in [
-                                "PAGE", "STATEMENT", "SUMMARY",
-                                "TOTAL", "WITHDRAWALS", "DEPOSITS"
-                            ])
+                            not HAS_AMOUNT_RE.search(line)
+                            and not NOISE_LINE_RE.search(line)
                         ):
-                            current_tx["description"] += " " + line
+                            row_desc_parts[-1].append(line)
+
+    for tx, parts in zip(rows, row_desc_parts):
+        tx["description"] = " ".join(parts)
 
     # ---- Handle month with NO transactions
     if not rows and balance_bf is not None:
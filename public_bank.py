@@ -19,38 +19,42 @@ BAL_ONLY = re.compile(
     re.IGNORECASE
 )
 
-TX_KEYWORDS = [
+# Tuples so str.startswith can test every prefix in one call
+TX_KEYWORDS = (
     "TSFR", "DUITNOW", "GIRO", "JOMPAY", "RMT", "DR-ECP",
     "HANDLING", "FEE", "DEP", "RTN", "PROFIT",
     "CHARGES", "DEBIT", "CREDIT", "TRANSFER", "PAYMENT"
-]
+)
 
-IGNORE_PREFIXES = [
+IGNORE_PREFIXES = (
     "CLEAR WATER", "/ROC", "PVCWS", "IMEPS",
     "PUBLIC BANK", "PAGE", "TEL:", "MUKA SURAT",
     "TARIKH", "DATE", "NO.", "URUS NIAGA",
     "STATEMENT", "ACCOUNT"
+)
+
+# Statement-year headers, tried in order
+YEAR_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r'(?:STATEMENT DATE|TARIKH PENYATA)\s*[:\s]+\d{1,2}/\d{1,2}/(\d{2,4})',
+        r'Statement\s+(?:Date|Period)[:\s]+\d{1,2}/\d{1,2}/(\d{4})',
+        r'FOR\s+THE\s+PERIOD[:\s]+\d{1,2}/\d{1,2}/(\d{4})',
+        r'(\d{4})\s+Statement'
+    )
 ]
 
 # ==========================
 # HELPERS
 # ==========================
 def is_ignored(line):
-    return any(line.upper().startswith(p) for p in IGNORE_PREFIXES)
+    return line.upper().startswith(IGNORE_PREFIXES)
 
 def is_tx_start(line):
-    return any(line.upper().startswith(k) for k in TX_KEYWORDS)
+    return line.upper().startswith(TX_KEYWORDS)
 
 def extract_year_from_text(text):
-    patterns = [
-        r'(?:STATEMENT DATE|TARIKH PENYATA)\s*[:\s]+\d{1,2}/\d{1,2}/(\d{2,4})',
-        r'Statement\s+(?:Date|Period)[:\s]+\d{1,2}/\d{1,2}/(\d{4})',
-        r'FOR\s+THE\s+PERIOD[:\s]+\d{1,2}/\d{1,2}/(\d{4})',
-        r'(\d{4})\s+Statement'
-    ]
-
-    for p in patterns:
-        m = re.search(p, text, re.IGNORECASE)
+    for p in YEAR_PATTERNS:
+        m = p.search(text)
         if m:
             y = m.group(1)
             return y if len(y) == 4 else str(2000 + int(y))
@@ -67,8 +71,11 @@ def extract_public_bank(pdf_path):
     with pdfplumber.open(pdf_path) as pdf:
 
         # -------- Detect year from first pages --------
+        # Keep the text so the parse loop does not extract these pages again
+        head_texts = []
         for page in pdf.pages[:3]:
             text = page.extract_text() or ""
+            head_texts.append(text)
             detected_year = extract_year_from_text(text)
             if detected_year:
                 break
@@ -77,13 +84,16 @@ def extract_public_bank(pdf_path):
             detected_year = str(datetime.now().year)
 
         # -------- Parse pages --------
-        for page in pdf.pages:
-            text = page.extract_text() or ""
+        for page_idx, page in enumerate(pdf.pages):
+            if page_idx < len(head_texts):
+                text = head_texts[page_idx]
+            else:
+                text = page.extract_text() or ""
             lines = text.splitlines()
 
             current_date = None
             prev_balance = None
-            desc_accum = ""
+            desc_accum = []
             waiting_for_amount = False
 
             for line in lines:
@@ -97,7 +107,7 @@ def extract_public_bank(pdf_path):
                     prev_balance = float(
                         bal_match.group("balance").replace(",", "")
                     )
-                    desc_accum = ""
+                    desc_accum = []
                     waiting_for_amount = False
                     continue
 
@@ -117,8 +127,9 @@ def extract_public_bank(pdf_path):
                         else:
                             final_desc = line.replace(amount_match.group(0), "").strip()
                     else:
-                        final_desc = (desc_accum + " " +
-                                      line.replace(amount_match.group(0), "").strip())
+                        final_desc = " ".join(
+                            desc_accum + [line.replace(amount_match.group(0), "").strip()]
+                        )
 
                     debit = credit = 0.0
                     if prev_balance is not None:
@@ -146,16 +157,16 @@ def extract_public_bank(pdf_path):
                     })
 
                     prev_balance = balance
-                    desc_accum = ""
+                    desc_accum = []
                     waiting_for_amount = False
 
                 elif is_new_start:
-                    desc_accum = date_match.group("rest") if date_match else line
+                    desc_accum = [date_match.group("rest") if date_match else line]
                     current_date = date_match.group("date") if date_match else current_date
                     waiting_for_amount = True
 
                 elif waiting_for_amount:
-                    desc_accum += " " + line
+                    desc_accum.append(line)
 
     df = pd.DataFrame(
         transactions,
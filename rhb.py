@@ -1,4 +1,5 @@
 import pdfplumber
+import numpy as np
 import pandas as pd
 import re
 
@@ -9,6 +10,14 @@ TX_LINE_PATTERN = re.compile(
     r"^\s*(\d{1,2})\s*([A-Za-z]{3})\s+(.*?)\s+([0-9,]+\.\d{2})\s+([0-9,]+\.\d{2})\s*$"
 )
 
+YEAR_PATTERN = re.compile(r"(20\d{2})")
+
+# Line that starts like a transaction date ("01 Jan", "1Jan")
+DATE_PREFIX_PATTERN = re.compile(r"^\s*\d{1,2}\s*[A-Za-z]{3}")
+
+# Cheap page-level check: every TX line carries at least one amount
+TX_HINT_PATTERN = re.compile(r"[0-9,]\.\d{2}")
+
 IGNORE_LINES = [
     "RHB Bank",
     "Page",
@@ -17,88 +26,129 @@ IGNORE_LINES = [
     "Total Count",
     "Member of PIDM",
 ]
+IGNORE_PATTERN = re.compile("|".join(map(re.escape, IGNORE_LINES)))
 
 CREDIT_KEYWORDS = [
     "CR", "DEPOSIT", "INWARD", "HIBAH", "PROFIT", "DEP", "CHEQUE"
 ]
 
+# Substring match, same as `k in desc.upper()` for each keyword
+CREDIT_PATTERN = re.compile("|".join(CREDIT_KEYWORDS), re.IGNORECASE)
+
+# Pages held open per pdfplumber.open() call, to bound memory on long PDFs
+PAGE_CHUNK = 10
+
+# ==========================
+# HELPERS
+# ==========================
+def iter_pages(pdf_path, chunk=PAGE_CHUNK):
+    """Yield pages in order, reopening the PDF every `chunk` pages."""
+    with pdfplumber.open(pdf_path) as pdf:
+        n_pages = len(pdf.pages)
+
+    for start in range(1, n_pages + 1, chunk):
+        pages = list(range(start, min(start + chunk, n_pages + 1)))
+        with pdfplumber.open(pdf_path, pages=pages) as pdf:
+            for page in pdf.pages:
+                try:
+                    yield page
+                finally:
+                    # drop the page's cached layout objects once parsed
+                    page.close()
+
+def to_cents(s):
+    # "1,234.56" -> 123456 (TX_LINE_PATTERN guarantees exactly 2 decimals)
+    return int(s.replace(",", "").replace(".", ""))
+
 # ==========================
 # MAIN EXTRACTOR
 # ==========================
 def extract_rhb(pdf_path):
-    transactions = []
+    # Column-wise buffers, one entry per transaction
+    dates = []
+    desc_parts = []  # list of description fragments per transaction
+    amounts = []
+    balances = []
 
     # Detect year from filename (fallback to current year if missing)
-    year_match = re.search(r"(20\d{2})", pdf_path)
+    year_match = YEAR_PATTERN.search(pdf_path)
     year = year_match.group(1) if year_match else "2024"
 
-    prev_balance = None
+    for page in iter_pages(pdf_path):
+        text = page.extract_text()
+        if not text:
+            continue
 
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            text = page.extract_text()
-            if not text:
+        # Amount-free pages (cover, terms) can only feed continuation
+        # lines, so they are skipped until the first transaction is seen
+        if not desc_parts and not TX_HINT_PATTERN.search(text):
+            continue
+
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+
+            # -------------------------
+            # TRANSACTION LINE
+            # -------------------------
+            # TX and date-prefixed lines always start with the day digit;
+            # skip both regexes for headers, footers and continuation text
+            starts_digit = line[0].isdigit()
+            m = TX_LINE_PATTERN.match(line) if starts_digit else None
+            if m:
+                day, month, desc, amt_str, bal_str = m.groups()
+
+                # Amounts kept in integer cents; debit/credit is decided
+                # for all rows at once after parsing
+                dates.append(f"{day} {month} {year}")
+                desc_parts.append([desc.strip()])
+                amounts.append(to_cents(amt_str))
+                balances.append(to_cents(bal_str))
                 continue
 
-            for line in text.splitlines():
-                line = line.strip()
-                if not line:
-                    continue
-
-                # -------------------------
-                # TRANSACTION LINE
-                # -------------------------
-                m = TX_LINE_PATTERN.match(line)
-                if m:
-                    day, month, desc, amt_str, bal_str = m.groups()
-
-                    amount = float(amt_str.replace(",", ""))
-                    balance = float(bal_str.replace(",", ""))
-
-                    debit = credit = 0.0
-
-                    # ----- Balance-diff logic -----
-                    if prev_balance is not None:
-                        if abs((prev_balance + amount) - balance) < 0.05:
-                            credit = amount
-                        elif abs((prev_balance - amount) - balance) < 0.05:
-                            debit = amount
-                        else:
-                            # Fallback keyword logic
-                            if any(k in desc.upper() for k in CREDIT_KEYWORDS):
-                                credit = amount
-                            else:
-                                debit = amount
-                    else:
-                        # First row fallback
-                        if any(k in desc.upper() for k in CREDIT_KEYWORDS):
-                            credit = amount
-                        else:
-                            debit = amount
-
-                    transactions.append({
-                        "date": f"{day} {month} {year}",
-                        "description": desc.strip(),
-                        "debit": debit,
-                        "credit": credit,
-                        "balance": balance
-                    })
-
-                    prev_balance = balance
-                    continue
-
-                # -------------------------
-                # MULTI-LINE DESCRIPTION
-                # -------------------------
-                if transactions:
-                    if not any(k in line for k in IGNORE_LINES):
-                        if not re.match(r"^\s*\d{1,2}\s*[A-Za-z]{3}", line):
-                            transactions[-1]["description"] += " " + line.strip()
-
-    df = pd.DataFrame(
-        transactions,
-        columns=["date", "description", "debit", "credit", "balance"]
-    )
+            # -------------------------
+            # MULTI-LINE DESCRIPTION
+            # -------------------------
+            if desc_parts:
+                if not IGNORE_PATTERN.search(line):
+                    if not (starts_digit and DATE_PREFIX_PATTERN.match(line)):
+                        desc_parts[-1].append(line)
+
+    if not dates:
+        return pd.DataFrame(
+            columns=["date", "description", "debit", "credit", "balance"]
+        )
+
+    df = pd.DataFrame({
+        "date": dates,
+        "description": [" ".join(parts) for parts in desc_parts],
+        "amount": amounts,
+        "balance": balances,
+    })
+
+    # -------------------------
+    # DEBIT / CREDIT CLASSIFICATION
+    # -------------------------
+    # A row is a credit when balance rose by exactly the amount and a
+    # debit when it fell by it; otherwise (and for the first row) the
+    # keyword fallback on the row's first description line decides.
+    amount = df["amount"].to_numpy()
+    balance = df["balance"].to_numpy()
+    delta = np.diff(balance, prepend=balance[:1])
+    has_prev = np.arange(len(df)) > 0
+
+    keyword_credit = pd.Series(
+        [parts[0] for parts in desc_parts]
+    ).str.contains(CREDIT_PATTERN).to_numpy()
+
+    balance_match = has_prev & (np.abs(delta) == amount)
+    is_credit = np.where(balance_match, delta == amount, keyword_credit)
+
+    df["debit"] = np.where(is_credit, 0, amount) / 100
+    df["credit"] = np.where(is_credit, amount, 0) / 100
+    df["balance"] = balance / 100
+    df = df[["date", "description", "debit", "credit", "balance"]]
 
     print(f"✔ RHB extracted {len(df)} rows from {pdf_path}")
     return df
@@ -1,6 +1,6 @@
 # transaction_patterns.py
 
-import regex as re
+import re
 
 # ---------------------------
 # Compiled regex patterns